@@ -50,7 +50,7 @@ import inspect as _inspect
 
 # Function to do this
 def _format_docstrings(width, indent, *modules):
-	completed = []
+	completed = set()
 	for module in modules:
 		for attr_str in dir(module): # TODO: Include member functions
 			attr = getattr(module, attr_str)
@@ -58,34 +58,24 @@ def _format_docstrings(width, indent, *modules):
 			and hasattr(attr, '__doc__') \
 			and not attr.__doc__ is None \
 			and not attr in completed:
-				completed.append(attr)
-				doc   = attr.__doc__
-				doc   = doc.expandtabs(indent)
-				lines = doc.split('\n')
-				lines.reverse() # Reverse iteration improves list efficiency from O(n) to O(1)
-				doc = ''
-				new = True
-				while len(lines) > 0:
+				completed.add(attr)
+				parts = [] # Joined once at the end rather than concatenated repeatedly
+				for line in attr.__doc__.expandtabs(indent).split('\n'):
 					# Indent
-					if new:
-						cur_indent = lines[-1].find(':') + 1
-						cur_indent += len(lines[-1][cur_indent:]) - len(lines[-1][cur_indent:].lstrip(' ')) + indent
-						new = False
-						new_width = width
-					else:
-						doc += ' '*cur_indent
-						new_width = width - cur_indent
+					cur_indent = line.find(':') + 1
+					cur_indent += len(line[cur_indent:]) - len(line[cur_indent:].lstrip(' ')) + indent
+					new_width = width
 
 					# Word wrap
-					if len(lines[-1]) > new_width:
-						break_index = lines[-1].rfind(' ', 0, new_width)
-						doc += lines[-1][0 : break_index]
-						lines[-1] = lines[-1][break_index + 1 :]
-					else:
-						doc += lines.pop(-1)
-						new = True
-					doc += '\n'
-				attr.__doc__ = doc
+					while len(line) > new_width:
+						break_index = line.rfind(' ', 0, new_width)
+						parts.append(line[0 : break_index])
+						parts.append('\n' + ' '*cur_indent)
+						line = line[break_index + 1 :]
+						new_width = width - cur_indent
+					parts.append(line)
+					parts.append('\n')
+				attr.__doc__ = ''.join(parts)
 
 # Import all modules privately
 from . import calc           as _calc
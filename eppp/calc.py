@@ -23,6 +23,8 @@
 #=========
 
 # External
+import functools       as _ft
+import math            as _math
 import numpy           as _np
 import scipy.constants as _sp_c
 from math import inf
@@ -31,6 +33,12 @@ from math import inf
 # Decibel conversions
 #=====================
 
+# Factor for each decibel definition
+_DB_FACTORS = {
+	'power':     10,
+	'amplitude': 20,
+}
+
 def from_db(x, db_type):
 	"""
 	Converts a number from its decibel form.
@@ -43,13 +51,13 @@ def from_db(x, db_type):
 		'x' converted from decibels.
 	"""
 
-	# Error checking
-	if not db_type in ('power', 'amplitude'):
+	# Error checking and factor for decibel definition
+	factor = _DB_FACTORS.get(db_type)
+	if factor is None:
 		raise ValueError("'db_type' must be either 'power' or 'amplitude'.")
 
 	# Conversion
-	factor = 10 if db_type == 'power' else 20 # Power decibels or not
-	return 10 ** (x/factor)                   # Return converted value
+	return 10 ** (x/factor) # Return converted value
 
 def to_db(x, db_type):
 	"""
@@ -63,13 +71,16 @@ def to_db(x, db_type):
 		'x' in decibels.
 	"""
 
-	# Error checking
-	if not db_type in ('power', 'amplitude'):
+	# Error checking and factor for decibel definition
+	factor = _DB_FACTORS.get(db_type)
+	if factor is None:
 		raise ValueError("'db_type' must be either 'power' or 'amplitude'.")
 
-	# Conversion
-	factor = 10 if db_type == 'power' else 20 # Power decibels or not
-	return factor*_np.log10(x)                # Return converted value
+	# Conversion, avoiding NumPy overhead for positive scalars
+	if isinstance(x, (int, float)) and x > 0:
+		return factor*_math.log10(x)
+
+	return factor*_np.log10(x) # Return converted value
 
 #====================
 # Physical phenomena
@@ -153,8 +164,13 @@ def skin_depth(
 	permittivity = rel_permittivity * _sp_c.epsilon_0
 	permeability = rel_permeability * _sp_c.mu_0
 	a            = resistivity * ang_freq * permittivity
+	b            = 2 * resistivity / (ang_freq * permeability)
+
+	# Avoid NumPy overhead for real scalars
+	if isinstance(a, float) and isinstance(b, float) and b >= 0:
+		return _math.sqrt(b) * _math.sqrt(_math.sqrt(1 + a**2) + a)
 
-	return _np.sqrt(2 * resistivity / (ang_freq * permeability)) * _np.sqrt(_np.sqrt(1 + a**2) + a)
+	return _np.sqrt(b) * _np.sqrt(_np.sqrt(1 + a**2) + a)
 
 def wire_resistance(
 		resistivity,
@@ -327,7 +343,19 @@ def solve_q_relation(freq=None, q=None, res=None, cap=None, ind=None):
 # Bandwidth
 #===========
 
+# Converts data to a contiguous float64 array (no copy if it already is one)
+def _asf64(a):
+	return _np.ascontiguousarray(a, dtype=_np.float64)
+
+# Magnitude ratio at the break frequency (few distinct 'decibel' values are used in practice)
+@_ft.lru_cache(maxsize=32)
+def _break_ratio(decibel):
+	return from_db(-decibel, 'amplitude')
+
 def _breakFreq(freqs, mags, di, decibel=3, is_stop_filter=False):
+	freqs = _asf64(freqs)
+	mags  = _asf64(mags)
+
 	# Size check
 	if freqs.size != mags.size:
 		raise ValueError("'freqs' and 'mags' must be of the same size.")
@@ -338,19 +366,23 @@ def _breakFreq(freqs, mags, di, decibel=3, is_stop_filter=False):
 
 	# Find out peak and break magnitude
 	peak_index = mags.argmax()
-	break_mags  = mags[peak_index]*db(-decibel, from_db = True)
+	break_mag  = mags[peak_index] * _break_ratio(decibel)
 
-	# Search
-	i = peak_index
-	while 0 <= i < mags.size:
-		if mags[i] < break_mag:
-			return freqs[i]
-		i += di
+	# Search from the peak in the direction of 'di'
+	if di > 0:
+		is_below = mags[peak_index:] < break_mag
+	else:
+		is_below = mags[peak_index::-1] < break_mag
+	i = is_below.argmax() # First element below break magnitude (0 if there is none)
+
+	# Return if found
+	if is_below[i]:
+		return freqs[peak_index + di*i]
 
 	# Out of bounds
-	if i < 0:
+	if di < 0:
 		return 0.
-	elif i >= mags.size:
+	else:
 		raise ValueError("High break frequency is not in interval.") # TODO: Only high?
 
 # Docstring decorator for 'lo_break_freq', 'hi_break_freq' and 'bandwidth'.
@@ -383,7 +415,7 @@ def hi_break_freq(freqs, mags, decibel=3, is_stop_filter=False):
 
 @_doc_bandwidth('bandwidth')
 def bandwidth(freqs, mags, decibel=3, is_stop_filter=False):
-	return hi_break_freq(freqs, mags, decibel, is_stop_filter) - lo_break_freq(freqs, mag, decibel, is_stop_filter)
+	return hi_break_freq(freqs, mags, decibel, is_stop_filter) - lo_break_freq(freqs, mags, decibel, is_stop_filter)
 
 #=========
 # Margins
@@ -402,29 +434,26 @@ def intersects(x, y, target):
 		float. x value for where y intersects target.
 	"""
 
-	# Offset to zero for simplicity
-	if target != 0:
-		return intersects(x, y - target, 0)
+	x = _asf64(x)
+	y = _asf64(y)
 
-	# Negate if below zero, return first if already intersects
-	if y[0] < 0:
-		return intersects(x, -y, 0)
-	elif y[0] == 0:
+	# Return first if already intersects
+	if y[0] == target:
 		return x[0]
 
-	# Search and return if found
-	i = 0
-	for el in y:
-		if el < 0:
-			# Return linear interpolation
-			# y[i] - y[i-1] will never be zero because of previous checks
-			# x[i-1] or y[i-1] will never be out of range because of previous checks
-			slope = -(x[i] - x[i-1]) / (y[i] - y[i-1])
-			return x[i-1] + slope * y[i-1]
-		i += 1
+	# Search for first element on the other side of target (no offset copy of 'y' needed)
+	is_crossed = _np.less(y, target) if y[0] > target else _np.greater(y, target)
+	i = is_crossed.argmax() # 0 if there is none
 
 	# Never reached target
-	raise ValueError("Data never intersects target.")
+	if not is_crossed[i]:
+		raise ValueError("Data never intersects target.")
+
+	# Return linear interpolation
+	# y[i] - y[i-1] will never be zero because of previous checks
+	# x[i-1] or y[i-1] will never be out of range because of previous checks
+	slope = -(x[i] - x[i-1]) / (y[i] - y[i-1])
+	return x[i-1] + slope * (y[i-1] - target)
 
 def unity_gain_freq(freqs, mags):
 	"""
@@ -457,13 +486,20 @@ def phase_180_freq(freqs, phases):
 		float. Frequency of 180 degrees phase shift.
 	"""
 
-	_180_freqs = [] # TODO: Better name
+	freqs  = _asf64(freqs)
+	phases = _asf64(phases)
+
+	# All 180 + 360*n levels within the phase range
+	levels = 180 + 360 * _np.arange(
+		_np.ceil( (phases.min() - 180) / 360),
+		_np.floor((phases.max() - 180) / 360) + 1,
+	)
 
-	# Loop through all necessary phase 360-offsets
-	for phase_offset in range( (int(_np.floor(min(phases))) / 360) * 360, (int(_np.ceil(max(phases))) / 360) * 360, 360): # TODO: Is int(...) necessary?
-		# Error means no intersection for given phase and can therefore be ignored
+	# First intersection of each level, one level at a time to keep memory use O(N)
+	_180_freqs = [] # TODO: Better name
+	for level in levels:
 		try:
-			_180_freqs.append(intersects(freqs, phases - phase_offset, 180))
+			_180_freqs.append(intersects(freqs, phases, level))
 		except ValueError:
 			pass
 
@@ -472,14 +508,35 @@ def phase_180_freq(freqs, phases):
 		return min(_180_freqs)
 	else:
 		# There were no 180 frequency
-		return ValueError("Phase never intersects 180 + 360*n.")
+		raise ValueError("Phase never intersects 180 + 360*n.")
+
+# Index of the element in 'freqs' nearest to 'freq' (first index on ties), with 'freqs' in ascending or descending order
+def _nearest_index(freqs, freq):
+	# Search descending frequencies in reversed order (a view, so nothing is copied)
+	is_descending = freqs[0] > freqs[-1]
+	if is_descending:
+		freqs = freqs[::-1]
+
+	# Binary search instead of taking the argmin of the distance to every element
+	i = int(_np.searchsorted(freqs, freq))
+	if i == len(freqs):
+		i -= 1
+
+	# On ties, take the element that comes first in the original order
+	elif i > 0:
+		if is_descending:
+			i = i-1 if freq - freqs[i-1] <  freqs[i] - freq else i
+		else:
+			i = i-1 if freq - freqs[i-1] <= freqs[i] - freq else i
+
+	return len(freqs) - 1 - i if is_descending else i
 
 def gain_margin(freqs, mags, phases, db_type):
 	"""
 	Calculates gain margin from magnitude and phase data, both as functions of frequency.
 
 	Args:
-		freqs (numpy.ndarray):  Frequency data.
+		freqs (numpy.ndarray):  Frequency data in ascending or descending order.
 		mags (numpy.ndarray):   Magnitude data.
 		phases (numpy.ndarray): Phase data.
 		db_type (string):       Whether to use the power decibel or amplitude decibel definition. Valid values are 'power' and 'amplitude'.
@@ -488,18 +545,23 @@ def gain_margin(freqs, mags, phases, db_type):
 		float. Gain margin. [dB]
 	"""
 
-	return -to_db(mags[abs(freqs - phase_180_freq(freqs, phases)).argmin()], db_type)
+	freqs = _asf64(freqs)
+	mags  = _asf64(mags)
+	return -to_db(mags[_nearest_index(freqs, phase_180_freq(freqs, phases))], db_type)
 
 def phase_margin(freqs, mags, phases):
 	"""
 	Calculates phase margin from magnitude and phase data, both as functions of frequency.
 
 	Args:
-		freqs (numpy.ndarray):  Frequency data.
+		freqs (numpy.ndarray):  Frequency data in ascending or descending order.
 		mags (numpy.ndarray):   Magnitude data.
 		phases (numpy.ndarray): Phase data.
 
 	Returns:
 		float. Phase margin. [degrees]
 	"""
-	return 180 + phases[abs(freqs - unity_gain_freq(freqs, mags)).argmin()]
+
+	freqs  = _asf64(freqs)
+	phases = _asf64(phases)
+	return 180 + phases[_nearest_index(freqs, unity_gain_freq(freqs, mags))]
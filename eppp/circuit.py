@@ -27,7 +27,7 @@ import itertools       as _it
 import operator        as _op
 import numpy           as _np
 import scipy.constants as _sp_c
-from bisect import bisect, insort
+from bisect import bisect, bisect_left, insort
 from math   import inf, nan
 
 # Internal
@@ -48,6 +48,9 @@ def func_sym_rep(sym_rep):
 
 # TODO: Document
 class ExprTree:
+	# Fixed attributes keep nodes small, since large searches build many trees
+	__slots__ = ('operator', 'operands', '_unit', '_size')
+
 	def __init__(
 			self,
 			polish_expr,
@@ -56,36 +59,45 @@ class ExprTree:
 			do_simplify = True,
 			unit        = '',
 		):
-		# Do not modify expression unless explicitly stated
-		if not do_consume:
-			polish_expr = list(polish_expr)
-
-		# Check so that a valid expression format has been given
-		if not is_reverse:
-			polish_expr.reverse()
-
-		# Unit for printing
-		self._unit = unit
-
-		# Operator and operands for this node
-		self.operator = None
-		self.operands = []
-
-		# Consume polishly
-		el = polish_expr.pop()
-		if callable(el): # If not leaf
-			self.operator = el
-
-			# Append the two operands
-			for i in range(2):
-				self.operands.append(ExprTree(
-					polish_expr,
-					do_consume = True,
-					is_reverse = True,
-					unit       = self._unit,
-				))
-		else: # If leaf
-			self.operands.append(el)
+		# Walk the expression with a cursor instead of copying and reversing it
+		index = -1 if is_reverse else 0
+		step  = -1 if is_reverse else 1
+
+		# Consume polishly, building child nodes with an explicit stack rather than recursion
+		nodes = [] # Pre-order
+		work  = [self]
+		while work:
+			node = work.pop()
+			nodes.append(node)
+
+			# Unit for printing
+			node._unit = unit
+
+			# Operator and operands for this node
+			node.operator = None
+			node.operands = []
+
+			el     = polish_expr[index]
+			index += step
+			if callable(el): # If not leaf
+				node.operator = el
+
+				# Create the two operands, to be consumed first to last
+				node.operands = [ExprTree.__new__(ExprTree) for i in range(2)]
+				work.extend(reversed(node.operands))
+			else: # If leaf
+				node.operands.append(el)
+
+		# Remove consumed elements only if explicitly stated
+		if do_consume:
+			if is_reverse:
+				del polish_expr[index + 1:]
+			else:
+				del polish_expr[:index]
+
+		# Number of leaves, kept up to date to avoid walking the tree when sorting (children before parents)
+		for node in reversed(nodes):
+			node._size = 1 if node._is_leaf() else sum(operand._size for operand in node.operands)
 
 		# Simplify
 		if do_simplify:
@@ -110,46 +122,62 @@ class ExprTree:
 		return self.operator is None
 
 	def _getSize(self):
-		if self._is_leaf():
-			# Leaf size = 1
-			return 1
-		else:
-			# Add size of children
-			ret = 0
-			for operand in self.operands:
-				ret += operand._getSize()
-			return ret
+		return self._size
 
 	def simplify(self):
-		if not self._is_leaf():
-			# Build new operands
+		# Flatten top-down, so that each node is visited once even for long chains of the same operator
+		work = [self]
+		while work:
+			node = work.pop()
+			if node._is_leaf():
+				continue
+
+			# Steal operands from descendants with the same operator as this node, keeping their order
 			new_operands = []
-			for operand in self.operands:
-				# Simplify child
-				operand.simplify()
-
-				# Steal child's operands if it is of the same type of operand as this one
+			pending      = node.operands[::-1]
+			while pending:
+				operand = pending.pop()
 				if \
 					not operand._is_leaf() \
-					and operand.operator is self.operator \
+					and operand.operator is node.operator \
 					:
-					new_operands.extend(operand.operands)
+					pending.extend(reversed(operand.operands))
 
-				# Add unmodified operand otherwise
+				# Keep other operands, and simplify them in turn
 				else:
 					new_operands.append(operand)
+					work.append(operand)
 
-			# Sort operands by size
-			new_operands.sort(key = lambda x: x._getSize())
+			# Sort operands by size (flattening does not change the number of leaves)
+			new_operands.sort(key = _op.attrgetter('_size'))
 
 			# Update data
-			self.operands = new_operands
+			node.operands = new_operands
 
 	def evaluate(self):
-		if self._is_leaf():
-			return self.operands[0]
-		else:
-			return _ft.reduce(self.operator, map(lambda x: x.evaluate(), self.operands))
+		# Post-order traversal with an explicit stack rather than recursion
+		stack = [(self, False)]
+		vals  = []
+		while stack:
+			node, is_expanded = stack.pop()
+
+			# Leaf value
+			if node._is_leaf():
+				vals.append(node.operands[0])
+
+			# All operands evaluated, so apply operator
+			elif is_expanded:
+				num_operands = len(node.operands)
+				args = vals[-num_operands:]
+				del vals[-num_operands:]
+				vals.append(_ft.reduce(node.operator, args))
+
+			# Evaluate operands first (pushed in reverse to be evaluated in order)
+			else:
+				stack.append((node, True))
+				stack.extend((operand, False) for operand in reversed(node.operands))
+
+		return vals[0]
 
 def inductor_impedance(ind, freq):
 	"""
@@ -166,15 +194,23 @@ def inductor_impedance(ind, freq):
 
 def capacitor_impedance(cap, freq):
 	"""
-	Calculates the impedance of capacitor for a given frequency.
+	Calculates the impedance of capacitor for a given frequency. If either argument is an array, the impedance is calculated element-wise.
 
 	Args:
-		cap (number):  Capacitance [F]
-		freq (number): Frequency   [Hz]
+		cap (number | numpy.ndarray):  Capacitance [F]
+		freq (number | numpy.ndarray): Frequency   [Hz]
 
 	Returns:
 		The impedance for a capacitor with the specified capacitance at the specified frequency. [Ω]
 	"""
+
+	# Element-wise if either argument is an array
+	if _np.ndim(cap) or _np.ndim(freq):
+		cap  = _np.asarray(cap)
+		freq = _np.asarray(freq)
+		with _np.errstate(divide='ignore', invalid='ignore'):
+			return _np.where((cap == 0) | (freq == 0), -1j * inf, 1 / (cap * 1j * 2 * _np.pi * freq))
+
 	if cap == 0 or freq == 0:
 		return -1j * inf
 	else:
@@ -266,6 +302,9 @@ def current_division(current, imp_main, *imps):
 		else:
 			return _np.sign(current * imp_others) * inf
 
+# Number of impedances above which 'parallel_impedance' sums admittances with NumPy (below it, array conversion costs more than it saves)
+_PARALLEL_IMPEDANCE_NUMPY_THRESHOLD = 256
+
 @func_sym_rep('||')
 def parallel_impedance(*vals):
 	"""
@@ -278,6 +317,29 @@ def parallel_impedance(*vals):
 		The equivalent impedance for all '*vals' impedances connected in parallel. [Ω]
 	"""
 
+	# Fast path for the common case of two impedances
+	if len(vals) == 2:
+		try:
+			admittance = 1 / vals[0] + 1 / vals[1]
+		except ZeroDivisionError:
+			return 0
+		try:
+			return 1 / admittance
+		except ZeroDivisionError:
+			return inf
+
+	# Sum admittances with NumPy if there are many scalar impedances
+	if len(vals) > _PARALLEL_IMPEDANCE_NUMPY_THRESHOLD:
+		vals_arr = _np.asarray(vals)
+		if vals_arr.ndim == 1 and vals_arr.dtype.kind in 'iufc':
+			# Return 0 if there is at least one 0 impedance
+			if (vals_arr == 0).any():
+				return 0
+
+			# Return equivalent impedance, or infinity if total admittance is 0
+			admittance = (1 / vals_arr).sum().item()
+			return inf if admittance == 0 else 1 / admittance
+
 	# Sum admittances
 	admittance = 0
 	try:
@@ -326,29 +388,20 @@ def clear_electronic_eval_state():
 	"""
 	_electronic_eval_idents = {}
 
-# TODO: ANTLR parser?
-# TODO: Allow to specify special units for variables. For example phi[°] = arcsin(1) prints in degrees instead of radians
-def electronic_eval(expr):
-	"""
-	Evaluates an expression. In addition to the normal arithmetic operators, addition ('+'), subtraction ('-'), multiplication ('*'), division ('/'), exponentiation ('^' or '**'), and assignment ('='), the parallel operator, '||' or '//', is supported. Functions defined in 'numpy' as well as constants defined in 'scipy.constants' are also supported. Superscript digits are expanded, which means that 2³ would expand to 2**(3). The result of the evaluation value is both returned and assigned to the variable 'ans'.
-
-	Args:
-		expr (string): Expression. Valid operators are: '=', '||' or '//', '+', '-', '*', '/' and '^' or '**'.
-
-	Returns:
-		[number]. The result of the evaluation.
-	"""
-
-	OPERATORS = {
-		_ast.Add:      _op.add,
-		_ast.Sub:      _op.sub,
-		_ast.USub:     _op.neg,
-		_ast.Mult:     _op.mul,
-		_ast.Div:      _op.truediv,
-		_ast.Pow:      _op.pow,
-		_ast.FloorDiv: parallel_impedance,
-	}
-
+# Operators supported by 'electronic_eval'
+_ELECTRONIC_EVAL_OPERATORS = {
+	_ast.Add:      _op.add,
+	_ast.Sub:      _op.sub,
+	_ast.USub:     _op.neg,
+	_ast.Mult:     _op.mul,
+	_ast.Div:      _op.truediv,
+	_ast.Pow:      _op.pow,
+	_ast.FloorDiv: parallel_impedance,
+}
+
+# Expands and parses an 'electronic_eval' expression (cached since the syntax tree is only read when evaluating)
+@_ft.lru_cache(maxsize=128)
+def _electronic_parse(expr):
 	# Remove whitespace at beginning and end
 	expr = expr.strip()
 
@@ -372,6 +425,21 @@ def electronic_eval(expr):
 	expr = expr.replace('^', '**')  # Allow '^' for exponentiation
 	expr = expr.replace('=', '==')  # Hijack '==' for assignment
 
+	return _ast.parse(expr, mode='eval').body
+
+# TODO: ANTLR parser?
+# TODO: Allow to specify special units for variables. For example phi[°] = arcsin(1) prints in degrees instead of radians
+def electronic_eval(expr):
+	"""
+	Evaluates an expression. In addition to the normal arithmetic operators, addition ('+'), subtraction ('-'), multiplication ('*'), division ('/'), exponentiation ('^' or '**'), and assignment ('='), the parallel operator, '||' or '//', is supported. Functions defined in 'numpy' as well as constants defined in 'scipy.constants' are also supported. Superscript digits are expanded, which means that 2³ would expand to 2**(3). The result of the evaluation value is both returned and assigned to the variable 'ans'.
+
+	Args:
+		expr (string): Expression. Valid operators are: '=', '||' or '//', '+', '-', '*', '/' and '^' or '**'.
+
+	Returns:
+		[number]. The result of the evaluation.
+	"""
+
 	# Evaluates the parsed abstract syntax tree
 	def eval_ast(node):
 		try:
@@ -412,25 +480,83 @@ def electronic_eval(expr):
 
 			# Binary operator
 			elif isinstance(node, _ast.BinOp):
-				return OPERATORS[type(node.op)](eval_ast(node.left), eval_ast(node.right))
+				return _ELECTRONIC_EVAL_OPERATORS[type(node.op)](eval_ast(node.left), eval_ast(node.right))
 
 			# Unary operator
 			elif isinstance(node, _ast.UnaryOp):
-				return OPERATORS[type(node.op)](eval_ast(node.operand))
+				return _ELECTRONIC_EVAL_OPERATORS[type(node.op)](eval_ast(node.operand))
 
 			# Unrecognized token error
 			else:
 				raise SyntaxError('Unrecognized token.')
 
-		# Operator not found in 'OPERATORS'
+		# Operator not found in '_ELECTRONIC_EVAL_OPERATORS'
 		except KeyError:
 			raise SyntaxError('Unrecognized operator.')
 
 	# Evaluate and return
-	res = eval_ast(_ast.parse(expr, mode='eval').body)
+	res = eval_ast(_electronic_parse(expr))
 	_electronic_eval_idents['ans'] = res
 	return res
 
+# Standard E-series of preferred values
+_E_SERIES = {}
+
+# Longest 2-digit series
+_E_SERIES['E24'] = (
+	10, 11, 12, 13, 15, 16, 18, 20, 22, 24, 27, 30,
+	33, 36, 39, 43, 47, 51, 56, 62, 68, 75, 82, 91,
+)
+
+# Longest 3-digit series
+_E_SERIES['E192'] = (
+	100, 101, 102, 104, 105, 106, 107, 109, 110, 111, 113, 114,
+	115, 117, 118, 120, 121, 123, 124, 126, 127, 129, 130, 132,
+	133, 135, 137, 138, 140, 142, 143, 145, 147, 149, 150, 152,
+	154, 156, 158, 160, 162, 164, 165, 167, 169, 172, 174, 176,
+	178, 180, 182, 184, 187, 189, 191, 193, 196, 198, 200, 203,
+	205, 208, 210, 213, 215, 218, 221, 223, 226, 229, 232, 234,
+	237, 240, 243, 246, 249, 252, 255, 258, 261, 264, 267, 271,
+	274, 277, 280, 284, 287, 291, 294, 297, 301, 305, 309, 312,
+	316, 320, 324, 328, 332, 336, 340, 344, 348, 352, 357, 361,
+	365, 370, 374, 379, 383, 388, 392, 397, 402, 407, 412, 417,
+	422, 427, 432, 437, 442, 448, 453, 459, 464, 470, 475, 481,
+	487, 493, 499, 505, 511, 517, 523, 530, 536, 542, 549, 556,
+	562, 569, 576, 583, 590, 597, 604, 612, 619, 626, 634, 642,
+	649, 657, 665, 673, 681, 690, 698, 706, 715, 723, 732, 741,
+	750, 759, 768, 777, 787, 796, 806, 816, 825, 835, 845, 856,
+	866, 876, 887, 898, 909, 920, 931, 942, 953, 965, 976, 988,
+)
+
+# Derived series
+for _series_num, _orig_series in [(3, 'E24'), (6, 'E24'), (12, 'E24'), (48, 'E192'), (96, 'E192')]:
+	_E_SERIES['E%d' % _series_num] = _E_SERIES[_orig_series][::len(_E_SERIES[_orig_series]) // _series_num]
+
+# Cached implementation of 'get_avail_vals' for hashable arguments
+@_ft.lru_cache(maxsize=32)
+def _get_avail_vals(basic_avail_vals, min_val, max_val, comp_type, freq):
+	basic_avail_vals = _np.array(basic_avail_vals, dtype=float)
+
+	# Decades that can contain values within limits
+	min_exp = int(_np.floor(_np.log10(min_val / basic_avail_vals.max())))
+	max_exp = int(_np.ceil( _np.log10(max_val / basic_avail_vals.min())))
+	exps    = _np.arange(min_exp, max_exp + 1)[:, None]
+
+	# Divide rather than multiply by negative powers of 10 to keep decimal values exact
+	decades    = 10.0 ** abs(exps)
+	avail_vals = _np.where(exps < 0, basic_avail_vals / decades, basic_avail_vals * decades).ravel()
+
+	# Filter out too high or too low values
+	avail_vals = avail_vals[(avail_vals >= min_val) & (avail_vals <= max_val)]
+
+	# Transform all values at once according to the type of component type
+	if comp_type == 'capacitor':
+		avail_vals = capacitor_impedance(avail_vals, freq)
+	elif comp_type == 'inductor':
+		avail_vals = inductor_impedance(avail_vals, freq)
+
+	return tuple(avail_vals.tolist())
+
 def get_avail_vals(
 		series    = 'E6',
 		min_val   = 10,
@@ -458,111 +584,34 @@ def get_avail_vals(
 	if comp_type in ['capacitor', 'inductor'] and freq == None:
 		raise Exception("'freq' must be specified if '%s' is chosen as component type." % comp_type)
 
-	# Derives an E-series from a higher one
-	def derive_series(series_num, orig_series):
-		skip = len(orig_series) / series_num
-		return [el for i, el in enumerate(orig_series) if i % skip == 0]
-
-	# Dictionary with common series
-	avail_vals_dict = {}
-
-	# Longest 2-digit series
-	avail_vals_dict['E24'] = [
-		10, 11, 12, 13, 15, 16, 18, 20, 22, 24, 27, 30,
-		33, 36, 39, 43, 47, 51, 56, 62, 68, 75, 82, 91,
-	]
-
-	# Longest 3-digit series
-	avail_vals_dict['E192'] = [
-		100, 101, 102, 104, 105, 106, 107, 109, 110, 111, 113, 114,
-		115, 117, 118, 120, 121, 123, 124, 126, 127, 129, 130, 132,
-		133, 135, 137, 138, 140, 142, 143, 145, 147, 149, 150, 152,
-		154, 156, 158, 160, 162, 164, 165, 167, 169, 172, 174, 176,
-		178, 180, 182, 184, 187, 189, 191, 193, 196, 198, 200, 203,
-		205, 208, 210, 213, 215, 218, 221, 223, 226, 229, 232, 234,
-		237, 240, 243, 246, 249, 252, 255, 258, 261, 264, 267, 271,
-		274, 277, 280, 284, 287, 291, 294, 297, 301, 305, 309, 312,
-		316, 320, 324, 328, 332, 336, 340, 344, 348, 352, 357, 361,
-		365, 370, 374, 379, 383, 388, 392, 397, 402, 407, 412, 417,
-		422, 427, 432, 437, 442, 448, 453, 459, 464, 470, 475, 481,
-		487, 493, 499, 505, 511, 517, 523, 530, 536, 542, 549, 556,
-		562, 569, 576, 583, 590, 597, 604, 612, 619, 626, 634, 642,
-		649, 657, 665, 673, 681, 690, 698, 706, 715, 723, 732, 741,
-		750, 759, 768, 777, 787, 796, 806, 816, 825, 835, 845, 856,
-		866, 876, 887, 898, 909, 920, 931, 942, 953, 965, 976, 988,
-	]
-
-	# Derived series
-	avail_vals_dict['E3']  = derive_series( 3, avail_vals_dict['E24'])
-	avail_vals_dict['E6']  = derive_series( 6, avail_vals_dict['E24'])
-	avail_vals_dict['E12'] = derive_series(12, avail_vals_dict['E24'])
-	avail_vals_dict['E48'] = derive_series(48, avail_vals_dict['E192'])
-	avail_vals_dict['E96'] = derive_series(96, avail_vals_dict['E192'])
-
 	# Get basic available values
 	if type(series) is str:
-		basic_avail_vals = avail_vals_dict[series]
+		basic_avail_vals = _E_SERIES[series]
 	else:
-		basic_avail_vals = series
-	avail_vals = list(basic_avail_vals)
+		basic_avail_vals = tuple(series)
 
-	# Append higher order series
-	multiplier = 10
-	while avail_vals[-1] <= max_val:
-		avail_vals += map(lambda x: x*multiplier, basic_avail_vals)
-		multiplier *= 10
-
-	# Reverse for more efficient list operations
-	avail_vals.reverse()
-	basic_avail_vals.reverse()
-
-	# Append lower order series
-	divider = 10
-	while avail_vals[-1] >= min_val:
-		avail_vals += map(lambda x: x / divider, basic_avail_vals)
-		divider    *= 10
-
-	# Reverse again for ordered list
-	avail_vals.reverse()
-
-	# Filter out too high or too low values
-	avail_vals = filter(lambda x: x <= max_val, avail_vals)
-	avail_vals = filter(lambda x: x >= min_val, avail_vals)
-
-	# Transform values according to the type of component type
-	if comp_type == 'resistor':
-		comp_specific_func = lambda x: x
-	elif comp_type == 'capacitor':
-		comp_specific_func = lambda x: capacitor_impedance(x, freq)
-	elif comp_type == 'inductor':
-		comp_specific_func = lambda x: inductor_impedance(x, freq)
-	avail_vals = map(comp_specific_func, avail_vals)
-
-	return list(avail_vals)
+	# Return a new list each time since the cached values must not be modified
+	return list(_get_avail_vals(basic_avail_vals, min_val, max_val, comp_type, freq))
 
 # Optimised way to evaluate polish expressions (faster than going through ExprTree)
 def _polish_eval(expr):
-	# Do not modify original expression
-	expr = list(expr)
-
 	# Start with an empty stack
 	stack = []
+	push  = stack.append
+	pop   = stack.pop
 
-	# While there are elements left in the expression
-	while expr:
-		el = expr.pop()
-
+	# Iterate backwards without modifying or copying the original expression
+	for el in reversed(expr):
 		# If operator
 		if callable(el):
-			expr.append(el(stack.pop(), stack.pop()))
+			push(el(pop(), pop()))
 
 		# If value
 		else:
-			stack.append(el)
+			push(el)
 
 	# Return the stack in the correct order
-	stack.reverse()
-	return stack
+	return stack[::-1]
 
 # Same as '_polish_eval' but with these differences:
 # - Assumes complete evaluation to exactly one element
@@ -590,7 +639,7 @@ except ImportError:
 			el = expr[i]
 
 			# If parallel operator
-			if el == _parallel_impedance_non_strict:
+			if el is _parallel_impedance_non_strict:
 				j += 1
 				k = j + 1
 				a = expr[k]
@@ -598,7 +647,7 @@ except ImportError:
 				expr[k] = (a * b) / (a + b)
 
 			# If series operator
-			elif el == _add:
+			elif el is _add:
 				j += 1
 				expr[j+1] = expr[j+1] + expr[j]
 
@@ -641,6 +690,15 @@ def make_resistance(
 	if not topology in ('mixed', 'series', 'parallel'):
 		raise ValueError("'topology' must be either 'mixed', 'series', or 'parallel'.")
 
+	# Sorted available values, so that the smallest and largest are at the ends
+	avail_vals = sorted(avail_vals)
+
+	# Largest tolerable absolute error
+	max_error = tolerance * target
+
+	# Available values as an array for vectorised full searches
+	avail_vals_arr = _np.asarray(avail_vals, dtype=float)
+
 	# Dynamic programming dictionary
 	results = {}
 
@@ -658,23 +716,34 @@ def make_resistance(
 		# Fully search for lower number of components
 		num_comps_fully_searched = num_comps - num_comps_full_search_lag
 		if 1 < num_comps_fully_searched <= num_comps_full_search:
-			for val in avail_vals:
-				for old_val in results_keyss[num_comps_fully_searched-1-1]:
-					expr = results[old_val]
-
+			old_vals     = results_keyss[num_comps_fully_searched-1-1]
+			results_keys = results_keyss[num_comps_fully_searched-1]
+
+			# Calculate series and parallel values for all combinations at once
+			vals_matrix     = avail_vals_arr[:, None]
+			old_vals_matrix = _np.asarray(old_vals,   dtype=float)[None, :]
+			series_valss    = (vals_matrix + old_vals_matrix).tolist()
+			parallel_valss  = (vals_matrix * old_vals_matrix / (vals_matrix + old_vals_matrix)).tolist()
+
+			# Hoist loop invariants out of the inner loop
+			do_series   = topology != 'parallel'
+			do_parallel = topology != 'series'
+			append_key  = results_keys.append
+
+			for val, series_vals, parallel_vals in zip(avail_vals, series_valss, parallel_valss):
+				for old_val, series_val, parallel_val in zip(old_vals, series_vals, parallel_vals):
 					# Store series result
-					if topology != 'parallel':
-						new_val = val + old_val
-						if not new_val in results:
-							results[new_val] = [_add, val, *expr]
-							insort(results_keyss[num_comps_fully_searched-1], new_val)
+					if do_series and not series_val in results:
+						results[series_val] = [_add, val, *results[old_val]]
+						append_key(series_val)
 
 					# Store parallel result
-					if topology != 'series':
-						new_val = (val * old_val) / (val + old_val)
-						if not new_val in results:
-							results[new_val] = [parallel_impedance, val, *expr]
-							insort(results_keyss[num_comps_fully_searched-1], new_val)
+					if do_parallel and not parallel_val in results:
+						results[parallel_val] = [parallel_impedance, val, *results[old_val]]
+						append_key(parallel_val)
+
+			# Sort once rather than inserting in order
+			results_keys.sort()
 
 		# When not doing more full searches, limit 'num_comps_fully_searched'
 		num_comps_fully_searched = min(num_comps_fully_searched, num_comps_full_search)
@@ -692,7 +761,7 @@ def make_resistance(
 		)
 
 		# Break if good enough
-		if abs(target - res[-1]) <= tolerance * target:
+		if abs(target - res[-1]) <= max_error:
 			break
 
 	# Convert to expression tree and return
@@ -719,26 +788,26 @@ def _make_resistance_helper(
 		index = bisect(results_keys, target)
 		try:
 			# Get pre-calculated results
-			val  = results_keys[index]
-			expr = results[val]
+			val   = results_keys[index]
+			error = abs(target - val)
 
 			# Update if better
-			if abs(target - val) < best_error:
+			if error < best_error:
 				best_val   = val
-				best_expr  = results[best_val]
-				best_error = abs(target - best_val)
+				best_expr  = results[val]
+				best_error = error
 		except IndexError:
 			pass
 		try:
 			# Get pre-calculated results
-			val  = results_keys[index-1]
-			expr = results[val]
+			val   = results_keys[index-1]
+			error = abs(target - val)
 
 			# Update if better
-			if abs(target - val) < best_error:
+			if error < best_error:
 				best_val   = val
-				best_expr  = expr
-				best_error = abs(target - best_val)
+				best_expr  = results[val]
+				best_error = error
 		except IndexError:
 			pass
 
@@ -746,10 +815,22 @@ def _make_resistance_helper(
 		if num_comps == 1 or num_comps <= num_comps_fully_searched:
 			return best_expr, best_val
 
+	# Range of values reachable by the remaining components
+	min_reach = avail_vals[ 0] / (num_comps-1)
+	max_reach = avail_vals[-1] * (num_comps-1)
+
+	# Only values below target can be added in series and only values above target in parallel
+	series_end     = bisect_left(avail_vals, target) if topology != 'parallel' else 0
+	parallel_start = bisect(avail_vals, target)      if topology != 'series'   else len(avail_vals)
+
 	# Include an additional resistance
-	for val in avail_vals:
+	for val in _it.chain(avail_vals[:series_end], avail_vals[parallel_start:]):
 		# Recursively add series resistance if undershooting target
-		if val < target and topology != 'parallel':
+		if val < target:
+			# Skip if no completion can beat the best error
+			if val + max_reach <= target - best_error:
+				continue
+
 			# Needed series resistance to hit target
 			needed = target - val
 
@@ -764,11 +845,15 @@ def _make_resistance_helper(
 				results,
 				results_keyss,
 			)
-			new_expr = [_add, val, *rec_expr]
-			new_val  = rec_val + val
+			new_op  = _add
+			new_val = rec_val + val
 
 		# Recursively add parallel resistance if overshooting target
-		elif val > target and topology != 'series':
+		else:
+			# Skip if no completion can beat the best error
+			if val * min_reach / (val + min_reach) >= target + best_error:
+				continue
+
 			# Needed parallel resistance to hit target
 			needed = (val * target) / (val - target)
 
@@ -783,24 +868,30 @@ def _make_resistance_helper(
 				results,
 				results_keyss,
 			)
-			new_expr = [parallel_impedance, val, *rec_expr]
-			new_val  = rec_val * val / (rec_val + val)
+			new_op  = parallel_impedance
+			new_val = rec_val * val / (rec_val + val)
 
-		# Continue if no new value was found
-		else:
+		# Continue without building the expression if neither new nor better
+		is_new = not new_val in results
+		error  = abs(target - new_val)
+		if not is_new and error >= best_error:
 			continue
+		new_expr = [new_op, val, *rec_expr]
 
 		# Save new expression if truly new
-		if not new_val in results:
+		if is_new:
 			results[new_val] = new_expr
 			new_num_comps = len(new_expr) // 2 + 1
 			insort(results_keyss[new_num_comps-1], new_val)
 
 		# Update if better
-		error = abs(target - new_val)
 		if error < best_error:
 			best_error = error
 			best_val   = new_val
 			best_expr  = new_expr
 
+			# An exact match can not be improved upon
+			if error == 0:
+				break
+
 	return best_expr, best_val
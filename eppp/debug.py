@@ -19,20 +19,17 @@
 def print_var(var, custom_name = None):
 	import inspect
 
-	# Get global and caller's local variables (the latter overrides the former)
-	context = dict(list(globals().items()) + list(inspect.currentframe().f_back.f_locals.items()))
-
 	if (custom_name == None):
-		# Print name
-		notFound = True
-		for name in context:
-			if context[name] is var:
+		# Print name, searching the caller's local variables before global variables
+		caller_locals = inspect.currentframe().f_back.f_locals
+		for context in (caller_locals, globals()):
+			name = next((name for name, val in context.items() if val is var), None)
+			if name is not None:
 				print(name)
-				notFound = False
 				break
 
 		# Print unknown name
-		if notFound:
+		else:
 			print('?expression?')
 	else:
 		print(custom_name)
@@ -29,8 +29,22 @@ from .circuit import capacitor_impedance, inductor_impedance
 # Shorthands
 #============
 
-_inv = _np.linalg.inv
-_det = _np.linalg.det
+# Determinant, in closed form for 2x2 matrices to avoid LAPACK overhead
+def _det(matrix):
+	if matrix.shape == (2, 2):
+		(m00, m01), (m10, m11) = matrix.tolist()
+		return m00*m11 - m01*m10
+	return _np.linalg.det(matrix)
+
+# Inverse, in closed form for 2x2 matrices to avoid LAPACK overhead
+def _inv(matrix):
+	if matrix.shape == (2, 2):
+		(m00, m01), (m10, m11) = matrix.tolist()
+		det = m00*m11 - m01*m10
+		if det == 0:
+			raise _np.linalg.LinAlgError('Singular matrix')
+		return _np.array([[m11/det, -m01/det], [-m10/det, m00/det]])
+	return _np.linalg.inv(matrix)
 
 #====================
 # Matrix conversions
@@ -107,7 +121,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To h-parameters
 	if (from_, to) == ('z', 'h'):
-		h = _np.ndarray((2, 2), dtype=complex)
+		h = _np.empty((2, 2), dtype=complex)
 		h[0][0] = _det(z)
 		h[0][1] = z[0][1]
 		h[1][0] = -z[1][0]
@@ -117,7 +131,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To g-parameters
 	if (from_, to) == ('z', 'g'):
-		g = _np.ndarray((2, 2), dtype=complex)
+		g = _np.empty((2, 2), dtype=complex)
 		g[0][0] = 1
 		g[0][1] = -z[0][1]
 		g[1][0] = z[1][0]
@@ -127,7 +141,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To a-parameters
 	if (from_, to) == ('z', 'a'):
-		a = _np.ndarray((2, 2), dtype=complex)
+		a = _np.empty((2, 2), dtype=complex)
 		a[0][0] = z[0][0]
 		a[0][1] = _det(z)
 		a[1][0] = 1
@@ -137,7 +151,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To b-parameters
 	if (from_, to) == ('z', 'b'):
-		b = _np.ndarray((2, 2), dtype=complex)
+		b = _np.empty((2, 2), dtype=complex)
 		b[0][0] = z[1][1]
 		b[0][1] = -_det(z)
 		b[1][0] = -1
@@ -163,7 +177,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To h-parameters
 	if (from_, to) == ('y', 'h'):
-		h = _np.ndarray((2, 2), dtype=complex)
+		h = _np.empty((2, 2), dtype=complex)
 		h[0][0] = 1
 		h[0][1] = -y[0][1]
 		h[1][0] = y[1][0]
@@ -173,7 +187,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To g-parameters
 	if (from_, to) == ('y', 'g'):
-		g = _np.ndarray((2, 2), dtype=complex)
+		g = _np.empty((2, 2), dtype=complex)
 		g[0][0] = _det(y)
 		g[0][1] = y[0][1]
 		g[1][0] = -y[1][0]
@@ -183,7 +197,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To a-parameters
 	if (from_, to) == ('y', 'a'):
-		a = _np.ndarray((2, 2), dtype=complex)
+		a = _np.empty((2, 2), dtype=complex)
 		a[0][0] = -y[1][1]
 		a[0][1] = -1
 		a[1][0] = -_det(y)
@@ -193,7 +207,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To b-parameters
 	if (from_, to) == ('y', 'b'):
-		b = _np.ndarray((2, 2), dtype=complex)
+		b = _np.empty((2, 2), dtype=complex)
 		b[0][0] = -y[0][0]
 		b[0][1] = 1
 		b[1][0] = _det(y)
@@ -215,7 +229,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To z-parameters
 	if (from_, to) == ('h', 'z'):
-		z = _np.ndarray((2, 2), dtype=complex)
+		z = _np.empty((2, 2), dtype=complex)
 		z[0][0] = _det(h)
 		z[0][1] = h[0][1]
 		z[1][0] = -h[1][0]
@@ -225,7 +239,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To y-parameters
 	if (from_, to) == ('h', 'y'):
-		y = _np.ndarray((2, 2), dtype=complex)
+		y = _np.empty((2, 2), dtype=complex)
 		y[0][0] = 1
 		y[0][1] = -h[0][1]
 		y[1][0] = h[1][0]
@@ -239,8 +253,8 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To a-parameters
 	if (from_, to) == ('h', 'a'):
-		a = _np.ndarray((2, 2), dtype=complex)
-		a[0][0] = -np.linalg.det(h)
+		a = _np.empty((2, 2), dtype=complex)
+		a[0][0] = -_det(h)
 		a[0][1] = -h[0][0]
 		a[1][0] = -h[1][1]
 		a[1][1] = -1
@@ -249,7 +263,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To b-parameters
 	if (from_, to) == ('h', 'b'):
-		b = _np.ndarray((2, 2), dtype=complex)
+		b = _np.empty((2, 2), dtype=complex)
 		b[0][0] = 1
 		b[0][1] = -h[0][0]
 		b[1][0] = -h[1][1]
@@ -259,7 +273,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To s-parameters
 	if (from_, to) == ('h', 's'):
-		s = _np.ndarray((2, 2), dtype=complex)
+		s = _np.empty((2, 2), dtype=complex)
 		s[0][0] = (h[0][0] - z0[0][0]) * (1 + z0[1][1]*h[1][1]) - z0[1][1]*h[0][1]*h[1][0]
 		s[0][1] = 2 * h[0][1] * _np.sqrt(z0[0][0] * z0[1][1])
 		s[1][0] = -2 * h[1][0] * _np.sqrt(z0[0][0] * z0[1][1])
@@ -276,7 +290,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To z-parameters
 	if (from_, to) == ('g', 'z'):
-		z = _np.ndarray((2, 2), dtype=complex)
+		z = _np.empty((2, 2), dtype=complex)
 		z[0][0] = 1
 		z[0][1] = -g[0][1]
 		z[1][0] = g[1][0]
@@ -286,7 +300,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To y-parameters
 	if (from_, to) == ('g', 'y'):
-		y = _np.ndarray((2, 2), dtype=complex)
+		y = _np.empty((2, 2), dtype=complex)
 		y[0][0] = _det(g)
 		y[0][1] = g[0][1]
 		y[1][0] = -g[1][0]
@@ -300,7 +314,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To a-parameters
 	if (from_, to) == ('g', 'a'):
-		a = _np.ndarray((2, 2), dtype=complex)
+		a = _np.empty((2, 2), dtype=complex)
 		a[0][0] = 1
 		a[0][1] = g[1][1]
 		a[1][0] = g[0][0]
@@ -310,7 +324,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To b-parameters
 	if (from_, to) == ('g', 'b'):
-		b = _np.ndarray((2, 2), dtype=complex)
+		b = _np.empty((2, 2), dtype=complex)
 		b[0][0] = -_det(g)
 		b[0][1] = g[1][1]
 		b[1][0] = g[0][0]
@@ -320,7 +334,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To s-parameters
 	if (from_, to) == ('g', 's'):
-		s = _np.ndarray((2, 2), dtype=complex)
+		s = _np.empty((2, 2), dtype=complex)
 		s[0][0] = (1 - g[0][0] + z0[0][0]) * (g[1][1] + z0[1][1]) + z0[1][1]*g[0][1]*g[1][0]
 		s[0][1] = -2 * g[0][1] * _np.sqrt(z0[0][0] * z0[1][1])
 		s[1][0] = 2 * g[1][0] * _np.sqrt(z0[0][0] * z0[1][1])
@@ -337,7 +351,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To z-parameters
 	if (from_, to) == ('a', 'z'):
-		z = _np.ndarray((2, 2), dtype=complex)
+		z = _np.empty((2, 2), dtype=complex)
 		z[0][0] = a[0][0]
 		z[0][1] = _det(a)
 		z[1][0] = 1
@@ -347,7 +361,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To y-parameters
 	if (from_, to) == ('a', 'y'):
-		y = _np.ndarray((2, 2), dtype=complex)
+		y = _np.empty((2, 2), dtype=complex)
 		y[0][0] = a[1][1]
 		y[0][1] = -_det(a)
 		y[1][0] = -1
@@ -357,7 +371,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To h-parameters
 	if (from_, to) == ('a', 'h'):
-		h = _np.ndarray((2, 2), dtype=complex)
+		h = _np.empty((2, 2), dtype=complex)
 		h[0][0] = a[0][1]
 		h[0][1] = _det(a)
 		h[1][0] = -1
@@ -367,7 +381,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To g-parameters
 	if (from_, to) == ('a', 'g'):
-		g = _np.ndarray((2, 2), dtype=complex)
+		g = _np.empty((2, 2), dtype=complex)
 		g[0][0] = a[1][0]
 		g[0][1] = -_det(a)
 		g[1][0] = 1
@@ -377,7 +391,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To b-parameters
 	if (from_, to) == ('a', 'b'):
-		b = _np.ndarray((2, 2), dtype=complex)
+		b = _np.empty((2, 2), dtype=complex)
 		b[0][0] = a[1][1]
 		b[0][1] = -a[0][1]
 		b[1][0] = -a[1][0]
@@ -387,7 +401,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To s-parameters
 	if (from_, to) == ('a', 's'):
-		s = _np.ndarray((2, 2), dtype=complex)
+		s = _np.empty((2, 2), dtype=complex)
 		s[0][0] = (
 			a[0][0] * z0[1][1] +
 			a[0][1] -
@@ -419,7 +433,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To z-parameters
 	if (from_, to) == ('b', 'z'):
-		z = _np.ndarray((2, 2), dtype=complex)
+		z = _np.empty((2, 2), dtype=complex)
 		z[0][0] = -b[1][1]
 		z[0][1] = -1
 		z[1][0] = -_det(b)
@@ -429,7 +443,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To y-parameters
 	if (from_, to) == ('b', 'y'):
-		y = _np.ndarray((2, 2), dtype=complex)
+		y = _np.empty((2, 2), dtype=complex)
 		y[0][0] = -b[1][1]
 		y[0][1] = 1
 		y[1][0] = _det(b)
@@ -439,7 +453,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To h-parameters
 	if (from_, to) == ('b', 'h'):
-		h = _np.ndarray((2, 2), dtype=complex)
+		h = _np.empty((2, 2), dtype=complex)
 		h[0][0] = -b[0][1]
 		h[0][1] = 1
 		h[1][0] = -_det(b)
@@ -449,7 +463,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To g-parameters
 	if (from_, to) == ('b', 'g'):
-		g = _np.ndarray((2, 2), dtype=complex)
+		g = _np.empty((2, 2), dtype=complex)
 		g[0][0] = -b[1][0]
 		g[0][1] = -1
 		g[1][0] = _det(b)
@@ -459,7 +473,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To a-parameters
 	if (from_, to) == ('b', 'a'):
-		a = _np.ndarray((2, 2), dtype=complex)
+		a = _np.empty((2, 2), dtype=complex)
 		a[0][0] = b[1][1]
 		a[0][1] = -b[0][1]
 		a[1][0] = -b[1][0]
@@ -471,7 +485,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 	# To s-parameters
 	if (from_, to) == ('b', 's'):
 		b /= b[0][0]*b[1][1] - b[0][1]*b[1][0]
-		s = _np.ndarray((2, 2), dtype=complex)
+		s = _np.empty((2, 2), dtype=complex)
 		s[0][0] = (
 			b[1][1] * z0[1][1] +
 			-b[0][1] -
@@ -513,7 +527,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To h-parameters
 	if (from_, to) == ('s', 'h'):
-		h = _np.ndarray((2, 2), dtype=complex)
+		h = _np.empty((2, 2), dtype=complex)
 		h[0][0] = ((1 + s[0][0]) * (1 + s[1][1]) - s[0][1] * s[1][0]) * z0[0][0]
 		h[0][1] = 2 * s[0][1] * _np.sqrt(z0[0][0] / z0[1][1])
 		h[1][0] = -2 * s[1][0] * _np.sqrt(z0[0][0] / z0[1][1])
@@ -523,7 +537,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To g-parameters
 	if (from_, to) == ('s', 'g'):
-		g = _np.ndarray((2, 2), dtype=complex)
+		g = _np.empty((2, 2), dtype=complex)
 		g[0][0] = ((1 - s[0][0]) * (1 - s[1][1]) - s[0][1] * s[1][0]) / z0[0][0]
 		g[0][1] = -2 * s[0][1] * _np.sqrt(z0[1][1] / z0[0][0])
 		g[1][0] = 2 * s[1][0] * _np.sqrt(z0[1][1] / z0[0][0])
@@ -533,7 +547,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To a-parameters
 	if (from_, to) == ('s', 'a'):
-		a = _np.ndarray((2, 2), dtype=complex)
+		a = _np.empty((2, 2), dtype=complex)
 		a[0][0] = (
 			_np.conj(z0[0][0]) * (1 - s[1][1]) +
 			z0[0][0] * (s[0][0] - _det(s))
@@ -554,7 +568,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To b-parameters
 	if (from_, to) == ('s', 'b'):
-		b = _np.ndarray((2, 2), dtype=complex)
+		b = _np.empty((2, 2), dtype=complex)
 		b[0][0] = (
 			_np.conj(z0[1][1]) * (1 - s[0][0]) +
 			z0[1][1] * (s[1][1] - _det(s))
@@ -575,7 +589,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To t-parameters
 	if (from_, to) == ('s', 't'):
-		t = _np.ndarray((2, 2), dtype=complex)
+		t = _np.empty((2, 2), dtype=complex)
 		t[0][0] = -_det(s)
 		t[0][1] = s[0][0]
 		t[1][0] = -s[1][1]
@@ -597,7 +611,7 @@ def convert_parameter_matrix(matrix, from_, to, char_imp=50):
 
 	# To s-parameters
 	if (from_, to) == ('t', 's'):
-		s = _np.ndarray((2, 2), dtype=complex)
+		s = _np.empty((2, 2), dtype=complex)
 		s[0][0] = t[0][1]
 		s[0][1] = _det(t)
 		s[1][0] = 1
@@ -883,7 +897,7 @@ def transmission_line_matrix(matrix_type, char_imp, prop_const, length):
 	"""
 
 	# Create a-matrix
-	matrix       = _np.ndarray((2, 2), dtype=complex)
+	matrix       = _np.empty((2, 2), dtype=complex)
 	angle        = prop_const * length
 	matrix[0][0] = _np.cosh(angle)
 	matrix[0][1] = _np.sinh(angle) * char_imp
@@ -908,7 +922,7 @@ def transformer_matrix(matrix_type, ratio, char_imp=50):
 	"""
 
 	# Create a-matrix
-	matrix       = _np.ndarray((2, 2), dtype=complex)
+	matrix       = _np.empty((2, 2), dtype=complex)
 	matrix[0][0] = ratio
 	matrix[0][1] = 0
 	matrix[1][0] = 0
@@ -945,7 +959,7 @@ def _doc_matrix_generator(topology, quantity, use_freq=False):
 @ _doc_matrix_generator('series', 'impedance')
 def series_impedance_matrix(matrix_type, imp, char_imp=50):
 	# Create a-matrix
-	matrix       = _np.ndarray((2, 2), dtype=complex)
+	matrix       = _np.empty((2, 2), dtype=complex)
 	matrix[0][0] = 1
 	matrix[0][1] = imp
 	matrix[1][0] = 0
@@ -957,7 +971,7 @@ def series_impedance_matrix(matrix_type, imp, char_imp=50):
 @ _doc_matrix_generator('shunt', 'admittance')
 def shunt_admittance_matrix(matrix_type, adm, char_imp=50):
 	# Create a-matrix
-	matrix = _np.ndarray((2, 2), dtype=complex)
+	matrix = _np.empty((2, 2), dtype=complex)
 	matrix[0][0] = 1
 	matrix[0][1] = 0
 	matrix[1][0] = adm
@@ -20,7 +20,8 @@
 #=========
 
 # External
-import matplotlib.pyplot as _pyplot
+# 'matplotlib.pyplot' is slow to import and is therefore imported in the functions that use it
+import numpy as _np
 
 # Internal
 from .calc import to_db as _to_db
@@ -49,13 +50,15 @@ def bode(
 		title_text (str):            Title text
 	"""
 
+	import matplotlib.pyplot as _pyplot
+
 	# Size check
 	if freq.size != mag.size != phase.size:
 		raise ValueError("'freq' and 'mag' and 'phase' must be of the same size.")
 
 	# Magnitude plot
 	_pyplot.subplot(211)
-	plot(freq, _to_db(mag, db_type))
+	_pyplot.plot(freq, _to_db(mag, db_type))
 	_pyplot.xscale('log')
 	_pyplot.ylabel('Magnitude [convert_db]')
 
@@ -64,7 +67,7 @@ def bode(
 
 	# Phase plot
 	_pyplot.subplot(212)
-	plot(freq, phase)
+	_pyplot.plot(freq, phase)
 	_pyplot.xscale('log')
 	_pyplot.ylabel('Phase [degrees]')
 
@@ -72,6 +75,8 @@ def bode(
 	_pyplot.xlabel('Frequency [Hz]')
 
 def heatmap(data, title_text = 'Heatmap', axes_unit = 'um', quantity_str = 'Magnitude [1]'):
+	import matplotlib.pyplot as _pyplot
+
 	# Data
 	x   = data['x']
 	y   = data['y']
@@ -81,7 +86,7 @@ def heatmap(data, title_text = 'Heatmap', axes_unit = 'um', quantity_str = 'Magn
 	_pyplot.hist2d(
 		x, y,
 		weights = mag,
-		bins = (len(_pyplot.unique(x)), len(_pyplot.unique(y))),
+		bins = (len(_np.unique(x)), len(_np.unique(y))),
 	)
 
 	# Plot colorbar
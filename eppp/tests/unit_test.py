@@ -20,6 +20,7 @@
 #=========
 
 # External
+import numpy    as np
 import unittest as ut
 from math import inf
 
@@ -38,7 +39,15 @@ eppp.set_log_level(0)
 #============
 
 class TestStringMethods(ut.TestCase):
-	# TODO: Test electronic_eval
+	def test_electronic_eval(self):
+		self.assertEqual(eppp.electronic_eval('1 || 1'), 0.5)  # Parallel
+		self.assertEqual(eppp.electronic_eval('2^3'), 8)       # Exponentiation
+		self.assertEqual(eppp.electronic_eval('2³'), 8)        # Superscript
+		self.assertEqual(eppp.electronic_eval('ans + 1'), 9)   # Previous result
+		eppp.electronic_eval('x = 2')
+		self.assertEqual(eppp.electronic_eval('x * 3'), 6)     # Assignment
+		eppp.electronic_eval('x = 4')
+		self.assertEqual(eppp.electronic_eval('x * 3'), 12)    # Reassignment
 
 	def test_make_resistance(self):
 		# Lower than available values
@@ -77,6 +86,55 @@ class TestStringMethods(ut.TestCase):
 			'(6.800 k + 10.00 k)'
 		)
 
+	def test_make_resistance_value(self):
+		# Error of the resulting network, independent of how ties are resolved
+		def error(target, **kwargs):
+			return abs(target - eppp.make_resistance(target, **kwargs).evaluate())
+
+		# Outside the range of available values
+		self.assertEqual(error(5), 0)
+		self.assertEqual(error(20e6), 0)
+
+		# Limited number of components
+		self.assertAlmostEqual(error(88120, max_num_comps=1), 11880)
+		self.assertAlmostEqual(error(88120, max_num_comps=2), 940.5128205128276)
+		self.assertAlmostEqual(error(88120, max_num_comps=3), 0.10899182560387999)
+		self.assertEqual(error(16800, max_num_comps=3, tolerance=0), 0)
+
+		# Full searches
+		self.assertAlmostEqual(error(12345, max_num_comps=5, tolerance=0), 0)
+		self.assertAlmostEqual(error(12345, max_num_comps=5, tolerance=0, num_comps_full_search_lag=1), 0)
+		self.assertAlmostEqual(error(12345, max_num_comps=5, tolerance=0, topology='series'), 0)
+		self.assertAlmostEqual(error(12345, max_num_comps=5, tolerance=0, topology='parallel'), 0.3036031231858942)
+		self.assertAlmostEqual(
+			error(
+				314.159,
+				avail_vals                = eppp.get_avail_vals('E3', max_val=1e3),
+				max_num_comps             = 6,
+				tolerance                 = 0,
+				num_comps_full_search_lag = 1,
+			),
+			0.014633011018645448,
+		)
+
+		# Several networks with the best error
+		self.assertAlmostEqual(
+			error(
+				10.479010335150521,
+				avail_vals                = [47.0, 65.4, 71.4, 81.8, 88.4],
+				max_num_comps             = 6,
+				tolerance                 = 0,
+				num_comps_full_search     = 2,
+				num_comps_full_search_lag = 2,
+			),
+			0.004656828313398975,
+		)
+
+	def test_get_avail_vals(self):
+		self.assertEqual(eppp.get_avail_vals('E3', min_val=1, max_val=100), [1, 2.2, 4.7, 10, 22, 47, 100]) # Standard series
+		self.assertEqual(eppp.get_avail_vals([1, 3], min_val=0.2, max_val=20), [0.3, 1, 3, 10])               # Custom series
+		self.assertEqual(len(eppp.get_avail_vals('E96', min_val=10, max_val=10e6)), 96*6 + 1)             # Count
+
 	def test_parallel_impedance(self):
 		self.assertEqual(eppp.parallel_impedance(3, 3, 3), 1)        # Three elements
 		self.assertEqual(eppp.parallel_impedance(1), 1)              # One element
@@ -84,6 +142,16 @@ class TestStringMethods(ut.TestCase):
 		self.assertEqual(eppp.parallel_impedance(1, 2), 2/3)         # Floating point
 		self.assertEqual(eppp.parallel_impedance(1, 0), 0)           # Zero
 		self.assertEqual(eppp.parallel_impedance(1, inf), 1)         # Infinity
+		self.assertAlmostEqual(eppp.parallel_impedance(*[1000]*1000), 1) # Many elements
+		self.assertEqual(eppp.parallel_impedance(*[1]*999, 0), 0)        # Many elements, zero
+		self.assertEqual(eppp.parallel_impedance(*[inf]*1000), inf)      # Many elements, infinity
+
+	def test_capacitor_impedance(self):
+		imps = np.array([-1e3j / (2*np.pi), -0.5e3j / (2*np.pi)])
+		self.assertAlmostEqual(eppp.capacitor_impedance(1e-6, 1e3), imps[0])                              # Scalars
+		np.testing.assert_allclose(eppp.capacitor_impedance(np.array([1e-6, 2e-6]), 1e3), imps)           # Capacitance array
+		np.testing.assert_allclose(eppp.capacitor_impedance(1e-6, np.array([1e3, 2e3])), imps)            # Frequency array
+		self.assertEqual(eppp.capacitor_impedance(1e-6, np.array([0., 1e3]))[0].imag, -inf)               # Zero frequency
 
 	def test_decibel(self):
 		# Power
@@ -94,6 +162,59 @@ class TestStringMethods(ut.TestCase):
 		self.assertEqual(eppp.to_db(100, db_type='amplitude'), 40)   # To dB
 		self.assertEqual(eppp.from_db(40, db_type='amplitude'), 100) # From dB
 
+	def test_break_freq(self):
+		freqs = np.arange(8.)
+
+		# Band-pass
+		mags = np.array([0.1, 0.5, 0.9, 1, 0.8, 0.7, 0.6, 0.5])
+		self.assertEqual(eppp.lo_break_freq(freqs, mags), 1)
+		self.assertEqual(eppp.hi_break_freq(freqs, mags), 5)
+		self.assertEqual(eppp.bandwidth(freqs, list(mags)), 4) # List input
+
+		# Low-pass
+		mags = np.array([1, 0.9, 0.8, 0.75, 0.72, 0.71, 0.6, 0.5])
+		self.assertEqual(eppp.lo_break_freq(freqs, mags), 0)
+		self.assertEqual(eppp.hi_break_freq(freqs, mags), 6)
+
+		# High-pass
+		self.assertRaises(ValueError, eppp.hi_break_freq, freqs, mags[::-1])
+
+	def test_intersects(self):
+		x = np.arange(4.)
+		y = np.array([3, 2, 0.5, -1])
+
+		self.assertAlmostEqual(eppp.intersects(x, y, 1), 5/3)     # Falling
+		self.assertAlmostEqual(eppp.intersects(x, -y, -1), 5/3)   # Rising
+		self.assertEqual(eppp.intersects(x, y, 3), 0)             # First element
+		self.assertEqual(eppp.intersects(x, y, 0.5), 2)           # Exact element
+		self.assertRaises(ValueError, eppp.intersects, x, y, 4)   # Never
+		self.assertAlmostEqual(eppp.unity_gain_freq(x, y), 5/3)   # Unity gain
+
+	def test_phase_180_freq(self):
+		freqs  = np.arange(4.)
+		phases = np.array([-90, -150, -210, -270])
+		self.assertAlmostEqual(eppp.phase_180_freq(freqs, phases), 1.5)                # -180
+		self.assertAlmostEqual(eppp.phase_180_freq(freqs, phases + 360), 1.5)          # 180
+		self.assertRaises(ValueError, eppp.phase_180_freq, freqs, phases / 10)         # Never
+		self.assertEqual(eppp.gain_margin(freqs, [20, 10, 1, 0.1], phases, 'power'), -10) # Gain margin
+
+	def test_phase_margin(self):
+		freqs  = np.arange(4.)
+		mags   = np.array([3, 2, 0.5, 0.1])
+		phases = np.array([-90, -100, -135, -170])
+		self.assertEqual(eppp.phase_margin(freqs, mags, phases), 45) # Nearest to 5/3
+		self.assertEqual(eppp.phase_margin(freqs[::-1], mags[::-1], phases[::-1]), 45) # Descending frequencies
+
+	def test_convert_parameter_matrix(self):
+		z = np.array([[10, 2], [3, 20]], dtype=complex)
+		y = eppp.convert_parameter_matrix(z, 'z', 'y')
+		np.testing.assert_allclose(y @ z, np.identity(2), atol=1e-15) # Inverse
+		for to in 'yhgabs':
+			np.testing.assert_allclose(eppp.convert_parameter_matrix(eppp.convert_parameter_matrix(z, 'z', to), to, 'z'), z) # Round trip
+		h = eppp.convert_parameter_matrix(z, 'z', 'h')
+		np.testing.assert_allclose(eppp.convert_parameter_matrix(h, 'h', 'a'), eppp.convert_parameter_matrix(z, 'z', 'a')) # Via h
+		self.assertRaises(np.linalg.LinAlgError, eppp.convert_parameter_matrix, np.ones((2, 2)), 'z', 'y') # Singular
+
 	def test_sci_notation(self):
 		# Correct number of significant figures
 		eppp.set_default_str_sci_args(num_sig_figs=3)